@@ -0,0 +1,981 @@
+#!/usr/bin/env python3
+"""
+Shared JIRA import logic for the dashboard adoption scripts.
+
+The project-specific scripts (jira_import_cp.py, jira_import_dashboard.py)
+only define their project configuration and epic/story data, and call
+run_import() from this module.
+
+Requirements:
+    pip install requests
+    pip install orjson  # optional, faster JSON encoding/decoding
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import argparse
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    json_loads = json.loads
+
+# JIRA Configuration - use environment variables for secrets
+JIRA_BASE_URL = "https://aigos.atlassian.net"
+JIRA_EMAIL = os.environ.get("JIRA_EMAIL", "")
+JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN", "")
+BULK_ISSUE_URL = f"{JIRA_BASE_URL}/rest/api/3/issue/bulk"
+FIELD_URL = f"{JIRA_BASE_URL}/rest/api/3/field"
+# Per project and issue type; filled in with str.format()
+CREATEMETA_URL = JIRA_BASE_URL + "/rest/api/3/issue/createmeta/{project_key}/issuetypes/{issue_type_id}"
+BOARD_URL = JIRA_BASE_URL + "/jira/software/projects/{project_key}/boards"
+
+
+def _worker_count() -> int:
+    value = os.environ.get("JIRA_IMPORT_WORKERS") or "8"
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        sys.exit(f"Error: JIRA_IMPORT_WORKERS must be a positive integer, got {value!r}")
+    return workers
+
+
+# Maximum number of concurrent bulk requests (bounded to respect rate limits).
+# Sizes both the worker pool and the session's connection pool; raise it with
+# JIRA_IMPORT_WORKERS if the tenant allows more concurrent requests.
+MAX_WORKERS = _worker_count()
+
+# JIRA accepts at most 50 issues per bulk create request
+BULK_LIMIT = 50
+
+
+class JitteredRetry(Retry):
+    """Retry whose exponential backoff is spread by +/-25%.
+
+    Jitter keeps concurrent workers that hit the same 429/503 from retrying
+    in lockstep. A Retry-After header, when present, still takes precedence.
+
+    POSTs (bulk creates) are not idempotent: JIRA may already have created
+    the issues when a 5xx or a read timeout comes back, so they are only
+    resent on a 429, which JIRA rejects before doing any work. GETs are
+    retried on every status in the forcelist and on read errors.
+    """
+
+    def get_backoff_time(self) -> float:
+        return super().get_backoff_time() * random.uniform(0.75, 1.25)
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        # Responses retried here never reach the callers' RATE_LIMITER.update():
+        # report them first, so a 429's Retry-After holds every worker and not
+        # only the one sleeping through this retry
+        if response is not None:
+            RATE_LIMITER.update(response.status, response.headers)
+        return super().increment(method, url, response, *args, **kwargs)
+
+
+# Shared HTTP session: reuses pooled TLS connections across all issue creates
+# and retries transient failures (rate limiting, gateway errors on GETs;
+# see JitteredRetry for POSTs). The pool
+# holds one connection per worker and blocks instead of opening throwaway
+# extras, so a run performs at most MAX_WORKERS TLS handshakes.
+SESSION = requests.Session()
+SESSION.auth = (JIRA_EMAIL, JIRA_API_TOKEN)
+SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_WORKERS,
+    pool_block=True,
+    max_retries=JitteredRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Read errors are only retried for these; POST statuses: is_retry()
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
+
+# Hold all requests until X-RateLimit-Reset once fewer requests than this remain
+RATE_LIMIT_LOW_REMAINING = 5
+
+# Names JIRA uses for the story points field (company- and team-managed projects)
+STORY_POINTS_FIELD_NAMES = ("Story Points", "Story point estimate")
+
+# JIRA's limits for the summary and (rich text) description fields
+SUMMARY_MAX_LENGTH = 255
+DESCRIPTION_MAX_LENGTH = 32767
+
+# Files the import writes (log, dry-run payloads, ledgers) live next to the
+# scripts, whatever the current directory; scripts/.gitignore covers them
+OUTPUT_DIR = Path(__file__).resolve().parent
+
+# Full response bodies of failed requests are only written to this file
+LOG_FILE = OUTPUT_DIR / "jira_import.log"
+
+log = logging.getLogger("jira_import")
+_logging_lock = threading.Lock()
+
+
+def setup_logging():
+    """Send progress output to stdout and debug detail to LOG_FILE through a queue.
+
+    Worker threads only enqueue records; a single listener thread does the
+    blocking writes, so terminal I/O never stalls a request. Safe to call
+    from concurrent imports: handlers are only attached once.
+    """
+    with _logging_lock:
+        if log.handlers:
+            return
+
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setLevel(logging.INFO)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        file_handler = RotatingFileHandler(LOG_FILE, maxBytes=1_000_000, backupCount=3)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+
+        log.addHandler(QueueHandler(log_queue))
+        log.setLevel(logging.DEBUG)
+        log.propagate = False
+
+        listener.start()
+        atexit.register(listener.stop)
+
+
+def freeze(data):
+    """Return a read-only copy of epic/story data (dicts become mappings, lists tuples).
+
+    The project scripts freeze their data at import so nothing (a payload
+    builder, a test patching one entry) can mutate it between runs.
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def intern_labels(data):
+    """Intern every label string in decoded JSON data, in place.
+
+    JSON decoding creates a new str for each occurrence of a value; interning
+    leaves one object per distinct label (e.g. "dashboard" on every epic).
+    """
+    if isinstance(data, dict):
+        if "labels" in data:
+            data["labels"] = [sys.intern(label) for label in data["labels"]]
+        for value in data.values():
+            intern_labels(value)
+    elif isinstance(data, list):
+        for value in data:
+            intern_labels(value)
+
+
+def load_data(path) -> MappingProxyType:
+    """Load epic/story data from a JSON file, frozen like inline data."""
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
+    intern_labels(data)
+    return freeze(data)
+
+
+def _is_str(value) -> bool:
+    return isinstance(value, str)
+
+
+def _is_points(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _is_labels(value) -> bool:
+    return isinstance(value, (list, tuple)) and all(isinstance(label, str) for label in value)
+
+
+def _is_object(value) -> bool:
+    return isinstance(value, Mapping)
+
+
+def _is_list(value) -> bool:
+    return isinstance(value, (list, tuple))
+
+
+# (field, required, check, expected) per record type; checked by validate_data()
+ENTRY_SCHEMA = (
+    ("epic", True, _is_object, "an object"),
+    ("stories", True, _is_list, "a list"),
+)
+EPIC_SCHEMA = (
+    ("summary", True, _is_str, "a string"),
+    ("description", True, _is_str, "a string"),
+    ("labels", False, _is_labels, "a list of strings"),
+)
+STORY_SCHEMA = (
+    ("summary", True, _is_str, "a string"),
+    ("description", False, _is_str, "a string"),
+    ("points", False, _is_points, "a non-negative integer"),
+)
+
+
+def _record_problems(record, schema: tuple) -> list:
+    if not _is_object(record):
+        return ["is not an object"]
+    problems = []
+    for field, required, check, expected in schema:
+        if field not in record:
+            if required:
+                problems.append(f"{field} is missing")
+        elif not check(record[field]):
+            problems.append(f"{field} must be {expected}")
+    return problems
+
+
+def validate_data(data):
+    """Check epic/story data against ENTRY_SCHEMA, EPIC_SCHEMA and STORY_SCHEMA.
+
+    Raises ValueError listing every malformed record, so a typo in the data
+    fails the run before any request is made instead of as a 400 from JIRA.
+    """
+    if not _is_list(data):
+        raise ValueError("Invalid epic/story data: expected a list of epic entries")
+
+    errors = []
+    for epic_index, epic_data in enumerate(data):
+        problems = _record_problems(epic_data, ENTRY_SCHEMA)
+        if problems:
+            errors.extend(f"entry {epic_index}: {problem}" for problem in problems)
+            continue
+
+        for problem in _record_problems(epic_data["epic"], EPIC_SCHEMA):
+            errors.append(f"epic {epic_index}: {problem}")
+        for story_index, story in enumerate(epic_data["stories"]):
+            for problem in _record_problems(story, STORY_SCHEMA):
+                errors.append(f"epic {epic_index}, story {story_index}: {problem}")
+
+    if errors:
+        raise ValueError("Invalid epic/story data:\n  " + "\n  ".join(errors))
+
+
+@functools.cache
+def adf(text: str) -> dict:
+    """Wrap plain text in a single-paragraph Atlassian Document Format body.
+
+    Cached per text: payloads are only serialized, never mutated, so issues
+    with identical descriptions share one body.
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}]
+            }
+        ]
+    }
+
+
+def seconds_until(reset: str) -> float:
+    """Seconds until a reset time given as delta seconds, an ISO 8601 timestamp
+    (X-RateLimit-Reset) or an HTTP-date (Retry-After). Unparseable values give 0.
+    """
+    try:
+        return max(0.0, float(reset))
+    except ValueError:
+        pass
+
+    try:
+        reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            reset_at = parsedate_to_datetime(reset)
+        except (TypeError, ValueError):
+            return 0.0
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _header_number(headers, name: str, cast, default):
+    try:
+        return cast(headers.get(name, default))
+    except ValueError:
+        return default
+
+
+class RateLimiter:
+    """Spaces out requests using the rate-limit hints JIRA sends back.
+
+    Each response's X-RateLimit-Interval-Seconds / X-RateLimit-FillRate give
+    the optimal gap between two requests. When X-RateLimit-Remaining drops
+    below RATE_LIMIT_LOW_REMAINING, or a 429 comes back with Retry-After,
+    every worker is held until the server is ready again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._interval = 0.0
+        self._next_ok = 0.0
+
+    def wait(self):
+        """Block until this caller's request slot opens."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_ok)
+            self._next_ok = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+    def update(self, status_code: int, headers):
+        """Adjust pacing from a response's status and rate-limit headers.
+
+        Each header is parsed on its own: one malformed value only disables
+        the adjustment that depends on it.
+        """
+        interval = _header_number(headers, "X-RateLimit-Interval-Seconds", float, 0.0)
+        fill_rate = _header_number(headers, "X-RateLimit-FillRate", float, 0.0)
+        remaining = _header_number(headers, "X-RateLimit-Remaining", int, RATE_LIMIT_LOW_REMAINING)
+
+        pause = 0.0
+        if status_code == 429 and "Retry-After" in headers:
+            pause = seconds_until(headers["Retry-After"])
+        if not pause and remaining < RATE_LIMIT_LOW_REMAINING and "X-RateLimit-Reset" in headers:
+            pause = seconds_until(headers["X-RateLimit-Reset"])
+
+        with self._lock:
+            if interval > 0 and fill_rate > 0:
+                self._interval = interval / fill_rate
+            if pause > 0:
+                self._next_ok = max(self._next_ok, time.monotonic() + pause)
+
+
+RATE_LIMITER = RateLimiter()
+
+
+def create_issues(issue_updates: list) -> list:
+    """Create up to BULK_LIMIT issues in one request and return their keys in order.
+
+    Issues JIRA rejects are reported and come back as None.
+    """
+    RATE_LIMITER.wait()
+    body = json_dumps({"issueUpdates": issue_updates})
+    try:
+        response = SESSION.post(BULK_ISSUE_URL, data=body, timeout=30)
+    except requests.RequestException as exc:
+        # Not retried: JIRA may have processed the request before it failed
+        log.error(
+            "Create request failed: %s (%d issues). JIRA may have created some of them; "
+            "check the project before rerunning.",
+            exc, len(issue_updates),
+        )
+        return [None] * len(issue_updates)
+    RATE_LIMITER.update(response.status_code, response.headers)
+
+    # 201: at least one issue created; 400: every element rejected. Both carry
+    # per-element errors, so failures can be reported issue by issue.
+    if response.status_code not in (201, 400):
+        log.warning("Create failed: %s (%d issues)", response.status_code, len(issue_updates))
+        log.debug("body=%s", response.text[:2048])
+        return [None] * len(issue_updates)
+
+    try:
+        data = json_loads(response.content)
+    except ValueError:
+        data = None
+    errors = data.get("errors", []) if isinstance(data, dict) else None
+
+    # A 201 means JIRA created at least one issue; if its body can't be read,
+    # which ones (and their keys) is unknown, and a rerun would duplicate them
+    readable = isinstance(errors, list) and isinstance(data.get("issues"), list)
+    if response.status_code == 201 and not readable:
+        log.error(
+            "Bulk create returned 201 for %d issues but the response could not be read: "
+            "the created keys are unknown. Check project %s by hand before rerunning.",
+            len(issue_updates),
+            issue_updates[0]["fields"]["project"]["key"],
+        )
+        log.debug("body=%s", response.text[:2048])
+        return [None] * len(issue_updates)
+
+    # A 400 without a list of per-element errors (an HTML error page, or a
+    # rejection of the request as a whole) fails the batch as a whole
+    if not isinstance(errors, list) or (response.status_code == 400 and not errors):
+        reasons = []
+        if isinstance(data, dict):
+            reasons.extend(data.get("errorMessages", []))
+        if isinstance(errors, dict):
+            reasons.extend(f"{field}: {message}" for field, message in errors.items())
+        log.warning(
+            "Create failed: %s (%d issues): %s",
+            response.status_code,
+            len(issue_updates),
+            "; ".join(map(str, reasons)) or "no error details",
+        )
+        log.debug("body=%s", response.text[:2048])
+        return [None] * len(issue_updates)
+
+    # Created issues are returned in request order, minus the failed elements
+    failed = {error["failedElementNumber"] for error in errors}
+    created = iter(data.get("issues", []))
+
+    for error in errors:
+        summary = issue_updates[error["failedElementNumber"]]["fields"]["summary"]
+        log.warning("Create failed for %r: %s", summary, error.get("elementErrors"))
+    if response.status_code == 400:
+        log.debug("body=%s", response.text[:2048])
+
+    return [
+        None if i in failed else next(created, {}).get("key")
+        for i in range(len(issue_updates))
+    ]
+
+
+def get_json(url: str, params: Optional[dict] = None):
+    """GET a JIRA resource and return its decoded body, or None on failure."""
+    RATE_LIMITER.wait()
+    response = SESSION.get(url, params=params, timeout=30)
+    RATE_LIMITER.update(response.status_code, response.headers)
+
+    if response.status_code != 200:
+        log.warning("GET %s failed: %s", url, response.status_code)
+        log.debug("body=%s", response.text[:2048])
+        return None
+
+    return json_loads(response.content)
+
+
+@functools.cache
+def create_fields(project_key: str, issue_type_id: str) -> Optional[tuple]:
+    """Fetch the fields on a project's create screen for one issue type.
+
+    Returns None if the metadata is unavailable (including an issue type the
+    project does not have).
+    """
+    url = CREATEMETA_URL.format(project_key=project_key, issue_type_id=issue_type_id)
+    fields = []
+    start_at = 0
+
+    while True:
+        page = get_json(url, {"startAt": start_at, "maxResults": 200})
+        if page is None:
+            return None
+
+        batch = page.get("fields", page.get("results", []))
+        fields.extend(batch)
+        start_at += len(batch)
+        if not batch or start_at >= page.get("total", 0):
+            return tuple(fields)
+
+
+@functools.cache
+def discover_story_points_field(project_key: str, story_type_id: str) -> Optional[str]:
+    """Look up the story points custom field ID once, before any issue is created.
+
+    Only the fields on the project's story create screen are requested, which
+    is a far smaller response than the tenant-wide field list and guarantees
+    the field can actually be set. Falls back to the full list if the scoped
+    endpoint is unavailable.
+    """
+    fields = create_fields(project_key, story_type_id)
+    if fields is not None:
+        return next(
+            (field["fieldId"] for field in fields if field.get("name") in STORY_POINTS_FIELD_NAMES),
+            None,
+        )
+
+    for field in get_json(FIELD_URL) or []:
+        if field.get("name") in STORY_POINTS_FIELD_NAMES:
+            return field["id"]
+
+    return None
+
+
+def validate_issue_type(project_key: str, issue_type_id: str, issue: dict) -> bool:
+    """Check a payload's issue type and required fields against the project's create metadata."""
+    fields = create_fields(project_key, issue_type_id)
+    if fields is None:
+        log.error("  Issue type %s: no create metadata in project %s", issue_type_id, project_key)
+        return False
+
+    missing = [
+        field["fieldId"] for field in fields
+        if field.get("required")
+        and not field.get("hasDefaultValue")
+        and field["fieldId"] not in issue["fields"]
+    ]
+    if missing:
+        log.error("  Issue type %s: required fields missing from payload: %s", issue_type_id, ", ".join(missing))
+        return False
+
+    log.info("  Issue type %s: OK", issue_type_id)
+    return True
+
+
+def payload_problems(issue: dict) -> list:
+    """Return the reasons JIRA would reject an issue payload, checked locally."""
+    fields = issue["fields"]
+    problems = []
+
+    summary = fields.get("summary", "")
+    if not summary.strip():
+        problems.append("summary is empty")
+    elif len(summary) > SUMMARY_MAX_LENGTH:
+        problems.append(f"summary is longer than {SUMMARY_MAX_LENGTH} characters")
+
+    text = fields["description"]["content"][0]["content"][0]["text"]
+    if len(text) > DESCRIPTION_MAX_LENGTH:
+        problems.append(f"description is longer than {DESCRIPTION_MAX_LENGTH} characters")
+
+    if not fields.get("issuetype", {}).get("id"):
+        problems.append("issue type ID is empty")
+
+    return problems
+
+
+class DryRun:
+    """Stand-in for create_issues that never calls JIRA.
+
+    Every payload is checked with payload_problems() and appended to an NDJSON
+    file; valid payloads get a synthetic DRY-n key, invalid ones None and are
+    counted in ``rejected``.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._created = 0
+        self.rejected = 0
+        self._file = open(path, "wb")
+
+    def __call__(self, issue_updates: list) -> list:
+        keys = []
+        with self._lock:
+            for issue in issue_updates:
+                self._file.write(json_dumps(issue) + b"\n")
+                problems = payload_problems(issue)
+                if problems:
+                    log.error("Invalid payload %r: %s", issue["fields"].get("summary"), "; ".join(problems))
+                    self.rejected += 1
+                    keys.append(None)
+                else:
+                    self._created += 1
+                    keys.append(f"DRY-{self._created}")
+        return keys
+
+    def close(self):
+        self._file.close()
+
+
+class Ledger:
+    """Append-only JSONL record of the issues an import has already created.
+
+    An issue is identified by its issue type, parent key and summary, so a
+    rerun after a partial failure skips everything that already exists and
+    reuses the recorded keys (epic keys become the stories' parents again).
+    Each line is flushed as soon as its batch is created.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._keys = {}
+
+        # A run killed mid-write can leave a truncated last line: skip it (its
+        # issue is looked up as new) and start the next entry on a fresh line
+        needs_newline = False
+        if path.exists():
+            with open(path, "rb") as f:
+                for line_number, line in enumerate(f, 1):
+                    needs_newline = not line.endswith(b"\n")
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json_loads(line)
+                        self._keys[(entry["type"], entry["parent"], entry["summary"])] = entry["key"]
+                    except (ValueError, TypeError, KeyError):
+                        log.warning("Skipping unreadable line %d in %s", line_number, path)
+
+        self._file = open(path, "ab")
+        if needs_newline:
+            self._file.write(b"\n")
+
+    @staticmethod
+    def identity(issue: dict) -> tuple:
+        fields = issue["fields"]
+        return fields["issuetype"]["id"], fields.get("parent", {}).get("key"), fields["summary"]
+
+    def get(self, issue: dict) -> Optional[str]:
+        """Return the key the issue was created with, or None if it is new."""
+        return self._keys.get(self.identity(issue))
+
+    def record(self, issue_updates: list, keys: list):
+        """Append every issue of a batch that was created, and flush."""
+        with self._lock:
+            for issue, key in zip(issue_updates, keys):
+                if key:
+                    issuetype, parent, summary = identity = self.identity(issue)
+                    self._keys[identity] = key
+                    entry = {"type": issuetype, "parent": parent, "summary": summary, "key": key}
+                    self._file.write(json_dumps(entry) + b"\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def create_issues_in_batches(
+    executor: ThreadPoolExecutor,
+    issue_updates: list,
+    create=create_issues,
+    ledger: Optional[Ledger] = None,
+) -> list:
+    """Create any number of issues as concurrent bulk requests and return their keys in order.
+
+    With a ``ledger``, issues it already records are not created again and
+    keep their recorded key; new ones are recorded batch by batch.
+    """
+    keys = [ledger.get(issue) if ledger else None for issue in issue_updates]
+    pending = [i for i, key in enumerate(keys) if key is None]
+    if len(pending) < len(keys):
+        log.info("Skipping %d issues already recorded in %s", len(keys) - len(pending), ledger.path)
+
+    def create_batch(indices: list) -> list:
+        batch = [issue_updates[i] for i in indices]
+        batch_keys = create(batch)
+        if ledger:
+            ledger.record(batch, batch_keys)
+        return batch_keys
+
+    batches = [pending[i:i + BULK_LIMIT] for i in range(0, len(pending), BULK_LIMIT)]
+    for indices, batch_keys in zip(batches, executor.map(create_batch, batches)):
+        for i, key in zip(indices, batch_keys):
+            keys[i] = key
+
+    return keys
+
+
+class IssueColumns(NamedTuple):
+    """Epic and story data split into parallel per-field lists.
+
+    Descriptions are already converted to ADF bodies. Story ``i`` belongs to
+    epic ``story_epic_indices[i]``.
+    """
+
+    epic_summaries: list
+    epic_descriptions: list
+    epic_labels: list
+    story_summaries: list
+    story_descriptions: list
+    story_points: list
+    story_epic_indices: list
+
+
+def flatten(data: list) -> IssueColumns:
+    """Walk the nested epic/story data once and split it into columns."""
+    columns = IssueColumns([], [], [], [], [], [], [])
+
+    for epic_index, epic_data in enumerate(data):
+        epic = epic_data["epic"]
+        columns.epic_summaries.append(epic["summary"])
+        columns.epic_descriptions.append(adf(epic["description"]))
+        columns.epic_labels.append(epic.get("labels", ()))
+
+        for story in epic_data["stories"]:
+            columns.story_summaries.append(story["summary"])
+            columns.story_descriptions.append(adf(story.get("description", "")))
+            columns.story_points.append(story.get("points", 0))
+            columns.story_epic_indices.append(epic_index)
+
+    return columns
+
+
+def epic_issue(
+    project: dict,
+    issuetype: dict,
+    summary: str,
+    description: dict,
+    labels,
+) -> dict:
+    """Build the create payload for an Epic.
+
+    ``project`` and ``issuetype`` are the shared per-run reference dicts.
+    """
+    issue_data = {
+        "fields": {
+            "project": project,
+            "summary": summary,
+            "description": description,
+            "issuetype": issuetype,
+        }
+    }
+
+    if labels:
+        issue_data["fields"]["labels"] = list(labels)
+
+    return issue_data
+
+
+def story_issue(
+    project: dict,
+    issuetype: dict,
+    story_points_field: Optional[str],
+    epic_key: str,
+    summary: str,
+    description: dict,
+    points: int,
+) -> dict:
+    """Build the create payload for a Story linked to an Epic.
+
+    ``project`` and ``issuetype`` are the shared per-run reference dicts.
+    """
+    issue_data = {
+        "fields": {
+            "project": project,
+            "summary": summary,
+            "description": description,
+            "issuetype": issuetype,
+            "parent": {"key": epic_key},
+        }
+    }
+
+    # Story points are only set when the project's custom field is known
+    if story_points_field:
+        issue_data["fields"][story_points_field] = points
+
+    return issue_data
+
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """Parse the command-line flags shared by the import scripts."""
+    parser = argparse.ArgumentParser(description="Import dashboard adoption epics and stories into JIRA.")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="build and check every payload and write it to scripts/payloads-<PROJECT>.ndjson; no HTTP",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="dry run that also checks issue types and required fields against JIRA's create metadata",
+    )
+    return parser.parse_args(argv)
+
+
+def run_import(
+    project_key: str,
+    epic_type_id: str,
+    story_type_id: str,
+    story_points_field: Optional[str],
+    data: list,
+    dry_run: bool = False,
+    validate: bool = False,
+):
+    """Import epics and their stories into a JIRA project.
+
+    ``data`` is a list of ``{"epic": {...}, "stories": [...]}`` entries; epics
+    need a ``summary`` and ``description`` (optionally ``labels``), stories a
+    ``summary``, ``description`` and ``points``. Malformed data raises
+    ValueError (see validate_data()) before any request is made. When
+    ``story_points_field`` is None, the field is discovered from JIRA before
+    anything is created.
+
+    With ``dry_run`` no issue is created: payloads are checked locally and
+    written to ``payloads-<project_key>.ndjson`` in OUTPUT_DIR. ``validate``
+    implies a dry run and additionally checks the payloads against the
+    project's create metadata (the only JIRA requests made).
+
+    Returns True on success: every issue was created or, in a dry run, no
+    payload was rejected and (with ``validate``) the create metadata check
+    passed. The scripts exit with status 1 otherwise.
+
+    A real import records every created issue in
+    ``imported-<project_key>.jsonl`` in OUTPUT_DIR; rerunning it (from any
+    directory) skips those issues, so an interrupted or partially failed
+    import can simply be run again. Delete the file to import from scratch.
+    """
+    validate_data(data)
+
+    dry_run = dry_run or validate
+    offline = dry_run and not validate
+
+    if not offline and (not JIRA_EMAIL or not JIRA_API_TOKEN):
+        sys.exit(
+            "Error: JIRA_EMAIL and JIRA_API_TOKEN environment variables must be set\n"
+            "  export JIRA_EMAIL='your-email@example.com'\n"
+            "  export JIRA_API_TOKEN='your-api-token'"
+        )
+
+    setup_logging()
+
+    columns = flatten(data)
+    total_epics = len(columns.epic_summaries)
+    total_stories = len(columns.story_summaries)
+
+    # Multi-line blocks are logged as one record each: one write, and no
+    # interleaving with a concurrent import's output
+    log.info(
+        "%s\nStarting JIRA import to project %s%s...\nWill create %d Epics and %d Stories\n%s",
+        "=" * 60, project_key, " (dry run)" if dry_run else "", total_epics, total_stories, "=" * 60,
+    )
+
+    if story_points_field is None:
+        if offline:
+            log.info("Dry run: story points field not discovered; payloads omit points")
+        else:
+            story_points_field = discover_story_points_field(project_key, story_type_id)
+            if story_points_field:
+                log.info("Using story points field %s", story_points_field)
+            else:
+                log.warning("No story points field found; stories will be created without points")
+
+    # Reference dicts shared by every payload of this run (never mutated)
+    project = {"key": project_key}
+    epic_type = {"id": epic_type_id}
+    story_type = {"id": story_type_id}
+
+    create = DryRun(OUTPUT_DIR / f"payloads-{project_key}.ndjson") if dry_run else create_issues
+    ledger = None if dry_run else Ledger(OUTPUT_DIR / f"imported-{project_key}.jsonl")
+    valid = True
+
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Epics go first in bulk; their keys are needed as story parents
+            epic_updates = [
+                epic_issue(project, epic_type, summary, description, labels)
+                for summary, description, labels in zip(
+                    columns.epic_summaries, columns.epic_descriptions, columns.epic_labels
+                )
+            ]
+            if validate and epic_updates:
+                valid &= validate_issue_type(project_key, epic_type_id, epic_updates[0])
+
+            # Issues an earlier run already created (found in the ledger) are
+            # reported apart from the ones this run creates
+            existing_epics = {i for i, issue in enumerate(epic_updates) if ledger and ledger.get(issue)}
+
+            log.info("\nCreating %d Epics...", total_epics)
+            epic_keys = create_issues_in_batches(executor, epic_updates, create, ledger)
+
+            created_lines = []
+            for i, (summary, epic_key) in enumerate(zip(columns.epic_summaries, epic_keys)):
+                if i in existing_epics:
+                    continue
+                if epic_key:
+                    created_lines.append(f"  Created: {epic_key} - {summary}")
+                else:
+                    log.error("  FAILED to create epic: %s", summary)
+            if created_lines:
+                log.info("\n".join(created_lines))
+
+            # Stories whose epic was created, still grouped by epic, in bulk batches
+            stories = [
+                i for i, epic_index in enumerate(columns.story_epic_indices)
+                if epic_keys[epic_index]
+            ]
+            story_updates = [
+                story_issue(
+                    project,
+                    story_type,
+                    story_points_field,
+                    epic_keys[columns.story_epic_indices[i]],
+                    columns.story_summaries[i],
+                    columns.story_descriptions[i],
+                    columns.story_points[i],
+                )
+                for i in stories
+            ]
+            if validate and story_updates:
+                valid &= validate_issue_type(project_key, story_type_id, story_updates[0])
+
+            existing_stories = {
+                i for i, issue in zip(stories, story_updates) if ledger and ledger.get(issue)
+            }
+
+            log.info("\nCreating %d Stories...", len(stories))
+            story_keys = create_issues_in_batches(executor, story_updates, create, ledger)
+    finally:
+        if dry_run:
+            create.close()
+        else:
+            ledger.close()
+
+    created_epics = sum(1 for i, key in enumerate(epic_keys) if key and i not in existing_epics)
+    created_stories = 0
+    total_points = 0
+    created_lines = []
+    for i, story_key in zip(stories, story_keys):
+        if i in existing_stories:
+            continue
+        summary = columns.story_summaries[i][:50]
+        if story_key:
+            created_stories += 1
+            total_points += columns.story_points[i]
+            created_lines.append(f"  Created: {story_key} ({columns.story_points[i]}pts) - {summary}")
+        else:
+            log.error("  FAILED to create story: %s", summary)
+    if created_lines:
+        log.info("\n".join(created_lines))
+
+    report = [
+        "",
+        "=" * 60,
+        f"Import to project {project_key} complete!",
+        f"  Epics created: {created_epics}/{total_epics}",
+        f"  Stories created: {created_stories}/{total_stories}",
+        f"  Total story points: {total_points}",
+    ]
+    if existing_epics or existing_stories:
+        report.append(
+            f"  Already imported (skipped): {len(existing_epics)} epics, {len(existing_stories)} stories"
+        )
+    report.append("=" * 60)
+    if dry_run:
+        report.append(f"Dry run: payloads written to {create.path}")
+        report.append(f"Payload checks: {f'{create.rejected} rejected' if create.rejected else 'passed'}")
+        if validate:
+            report.append(f"Validation against JIRA create metadata: {'passed' if valid else 'FAILED'}")
+        success = valid and not create.rejected
+    else:
+        report.append("View the board at:")
+        report.append("  " + BOARD_URL.format(project_key=project_key))
+        success = (
+            created_epics + len(existing_epics) == total_epics
+            and created_stories + len(existing_stories) == total_stories
+        )
+    log.info("\n".join(report))
+
+    return success
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+JIRA Import Script for all dashboard adoption projects
+
+Runs the CP and AP (dashboard) imports concurrently instead of one after
+the other. Both projects live on the same JIRA tenant, so the runs share
+jira_import's HTTP session and rate limiter: the tenant-wide rate limit is
+respected across both imports.
+
+Usage:
+    python jira_import_all.py [--dry-run | --validate]
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import jira_import_cp
+import jira_import_dashboard
+from jira_import import parse_args, run_import
+
+PROJECTS = (jira_import_cp, jira_import_dashboard)
+
+
+def main():
+    """Import every project's epics and stories concurrently.
+
+    Exits with status 1 if any project's import (or dry run) failed.
+    """
+    args = parse_args()
+
+    with ThreadPoolExecutor(max_workers=len(PROJECTS)) as executor:
+        futures = [
+            executor.submit(
+                run_import,
+                project.PROJECT_KEY,
+                project.EPIC_TYPE_ID,
+                project.STORY_TYPE_ID,
+                project.STORY_POINTS_FIELD,
+                project.EPICS_AND_STORIES,
+                **vars(args),
+            )
+            for project in PROJECTS
+        ]
+
+        results = [future.result() for future in futures]
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,32 +9,32 @@ Project: CP (control-plane)
 Issue Types:
   - Epic: 10197
   - Story: 10196
+
+Usage:
+    python jira_import_cp.py [--dry-run | --validate]
+
+Requirements:
+    pip install requests
+    pip install orjson  # optional, faster JSON encoding/decoding
+
+The import itself (bulk creation, pacing, retries) lives in jira_import.py.
 """
 
-import requests
-import json
-import time
-import os
-from typing import Optional
+import sys
 
-# JIRA Configuration - use environment variables for secrets
-JIRA_BASE_URL = "https://aigos.atlassian.net"
-JIRA_EMAIL = os.environ.get("JIRA_EMAIL", "")
-JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN", "")
-PROJECT_KEY = "CP"
+from jira_import import freeze, parse_args, run_import
 
-if not JIRA_EMAIL or not JIRA_API_TOKEN:
-    print("Error: JIRA_EMAIL and JIRA_API_TOKEN environment variables must be set")
-    print("  export JIRA_EMAIL='your-email@example.com'")
-    print("  export JIRA_API_TOKEN='your-api-token'")
-    exit(1)
+PROJECT_KEY = "CP"
 
 # Issue type IDs for CP project
 EPIC_TYPE_ID = "10197"
 STORY_TYPE_ID = "10196"
 
+# Story points field ID is discovered from JIRA at import time
+STORY_POINTS_FIELD = None
+
 # Dashboard Adoption Epics and Stories
-EPICS_AND_STORIES = [
+EPICS_AND_STORIES = freeze([
     {
         "epic": {
             "name": "Project Foundation & Infrastructure",
@@ -212,125 +212,16 @@ EPICS_AND_STORIES = [
             {"summary": "Achieve 80% code coverage", "points": 5, "description": "Ensure comprehensive test coverage."},
         ]
     },
-]
-
-
-def create_issue(issue_data: dict) -> Optional[str]:
-    """Create a JIRA issue and return its key."""
-    url = f"{JIRA_BASE_URL}/rest/api/3/issue"
-
-    response = requests.post(
-        url,
-        auth=(JIRA_EMAIL, JIRA_API_TOKEN),
-        headers={"Content-Type": "application/json"},
-        json=issue_data
-    )
-
-    if response.status_code == 201:
-        return response.json().get("key")
-    else:
-        print(f"Error creating issue: {response.status_code}")
-        print(response.text)
-        return None
-
-
-def create_epic(epic_data: dict) -> Optional[str]:
-    """Create an Epic and return its key."""
-    issue_data = {
-        "fields": {
-            "project": {"key": PROJECT_KEY},
-            "summary": epic_data["summary"],
-            "description": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": epic_data["description"]}]
-                    }
-                ]
-            },
-            "issuetype": {"id": EPIC_TYPE_ID},
-        }
-    }
-
-    return create_issue(issue_data)
-
-
-def create_story(story_data: dict, epic_key: str) -> Optional[str]:
-    """Create a Story linked to an Epic and return its key."""
-    issue_data = {
-        "fields": {
-            "project": {"key": PROJECT_KEY},
-            "summary": story_data["summary"],
-            "description": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": story_data.get("description", "")}]
-                    }
-                ]
-            },
-            "issuetype": {"id": STORY_TYPE_ID},
-            "parent": {"key": epic_key},
-        }
-    }
-
-    # Add story points if available (customfield may vary)
-    # Note: Story points field ID needs to be discovered for this project
-
-    return create_issue(issue_data)
-
-
-def main():
-    """Import all epics and stories to JIRA."""
-    print(f"Starting JIRA import to project {PROJECT_KEY}...")
-    print("=" * 60)
-
-    total_epics = len(EPICS_AND_STORIES)
-    total_stories = sum(len(e["stories"]) for e in EPICS_AND_STORIES)
-
-    print(f"Will create {total_epics} Epics and {total_stories} Stories")
-    print("=" * 60)
-
-    created_epics = 0
-    created_stories = 0
-
-    for i, epic_data in enumerate(EPICS_AND_STORIES, 1):
-        print(f"\n[{i}/{total_epics}] Creating Epic: {epic_data['epic']['name']}")
-
-        epic_key = create_epic(epic_data["epic"])
-        if epic_key:
-            created_epics += 1
-            print(f"  Created: {epic_key}")
-
-            # Create stories under this epic
-            for j, story in enumerate(epic_data["stories"], 1):
-                print(f"  [{j}/{len(epic_data['stories'])}] Creating Story: {story['summary'][:50]}...")
-                story_key = create_story(story, epic_key)
-                if story_key:
-                    created_stories += 1
-                    print(f"    Created: {story_key}")
-                else:
-                    print(f"    FAILED to create story")
-
-                # Small delay to avoid rate limiting
-                time.sleep(0.2)
-        else:
-            print(f"  FAILED to create epic")
-
-        # Delay between epics
-        time.sleep(0.5)
-
-    print("\n" + "=" * 60)
-    print(f"Import complete!")
-    print(f"  Epics created: {created_epics}/{total_epics}")
-    print(f"  Stories created: {created_stories}/{total_stories}")
-    print(f"  Total story points: 349")
-    print("=" * 60)
+])
 
 
 if __name__ == "__main__":
-    main()
+    if not run_import(
+        PROJECT_KEY,
+        EPIC_TYPE_ID,
+        STORY_TYPE_ID,
+        STORY_POINTS_FIELD,
+        EPICS_AND_STORIES,
+        **vars(parse_args()),
+    ):
+        sys.exit(1)